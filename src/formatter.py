@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any
+from typing import Any, Dict, List, Tuple
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -68,6 +68,56 @@ def format_data(analysis_results: Dict[str, Any]) -> str:
 
     return formatted_output.rstrip()
 
+part2_titles = {
+    "max_continuous": "Максимальная непрерывная длительность превышений:",
+    "max_total": "Максимальная общая длительность превышений:"
+}
+
+def line_runs(line: str) -> List[Tuple[str, bool, bool]]:
+    """
+    Разбивает строку part1 на фрагменты с оформлением. Общие правила для
+    вывода в docx и HTML; python-docx здесь не используется.
+
+    :param line: Строка из результата format_data
+    :return: Список фрагментов (текст, жирный, курсив)
+    """
+    if line == "Превышения ПДКмр:":  # Делаем заголовок жирным
+        return [(line, True, False)]
+    if line in ("Москва", "Московская область"):
+        return [(line, True, True)]
+
+    # Проверяем, является ли строка подзаголовком с "по {вещество} на"
+    if line.startswith("по ") and " АСКЗА:" in line:
+        parts = line.split(" АСКЗА:")
+        return [(parts[0] + " АСКЗА:", True, False), (parts[1], False, False)]
+
+    parts = line.split('на уровне 1 ПДКмр ')
+    if len(parts) > 1:
+        return [(parts[0], False, False), ('на уровне 1 ПДКмр ', True, False), (parts[1], False, False)]
+
+    parts = line.split("до ")
+    if len(parts) > 1:
+        level, rest = parts[1].split(' ПДКмр ')[:2]
+        return [(parts[0], False, False), (f"до {level} ПДКмр ", True, False), (rest, False, False)]
+
+    return [(line, False, False)]
+
+def format_part2_lines(part2_results: Dict[str, List[Dict[str, str]]]) -> List[Tuple[str, bool]]:
+    """
+    Форматирует результаты part2 в строки: "по {газу} – {детали}" с точкой
+    с запятой между записями раздела и точкой после последней.
+
+    :param part2_results: Результаты part2.analyze_part2
+    :return: Список пар (текст, является ли строка заголовком раздела)
+    """
+    lines = []
+    for section, entries in part2_results.items():
+        lines.append((part2_titles[section], True))
+        for i, entry in enumerate(entries):
+            ending = "." if i == len(entries) - 1 else ";"
+            lines.append((f"по {entry['название']} – {entry['детали']}{ending}", False))
+    return lines
+
 def main(analysis_results: Dict[str, Any]) -> str:
     """
     Основная функция для форматирования данных.
@@ -0,0 +1,70 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+import pandas as pd
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def file_fingerprint(file_path: str) -> Tuple[str, int, int]:
+    """
+    Возвращает отпечаток файла: абсолютный путь, время изменения и размер.
+
+    :param file_path: Путь к файлу
+    :return: Кортеж (путь, mtime в наносекундах, размер в байтах)
+    """
+    stat = os.stat(file_path)
+    return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+class FrameCache:
+    """LRU-кэш прочитанных Excel файлов, ключ - отпечаток файла."""
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read_excel(self, file_path: str) -> pd.DataFrame:
+        """
+        Возвращает копию DataFrame из кэша или читает файл и кэширует его.
+
+        :param file_path: Путь к Excel файлу
+        :return: DataFrame с данными файла
+        """
+        key = file_fingerprint(file_path)
+        with self._lock:
+            df = self._frames.get(key)
+            if df is not None:
+                self._frames.move_to_end(key)
+
+        if df is None:
+            df = pd.read_excel(file_path)
+            with self._lock:
+                self._frames[key] = df
+                self._frames.move_to_end(key)
+                while len(self._frames) > self.maxsize:
+                    self._frames.popitem(last=False)
+
+        # Вызывающий код добавляет столбцы, поэтому кэшированный DataFrame не отдаем наружу
+        return df.copy()
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+# По умолчанию кэш выключен: при однократном запуске каждый файл читается один раз
+_frame_cache: Optional[FrameCache] = None
+
+def enable_frame_cache(maxsize: int = 64) -> FrameCache:
+    """Включает общий для процесса кэш прочитанных Excel файлов."""
+    global _frame_cache
+    _frame_cache = FrameCache(maxsize)
+    logging.info(f"Кэш Excel файлов включен, размер: {maxsize}")
+    return _frame_cache
+
+def read_excel(file_path: str) -> pd.DataFrame:
+    """Читает Excel файл через кэш, если он включен."""
+    if _frame_cache is None:
+        return pd.read_excel(file_path)
+    return _frame_cache.read_excel(file_path)
@@ -1,53 +1,44 @@
 import os
+import argparse
 import logging
-from docx import Document
-from part1 import process_part1
-from part2 import process_part2
+from renderer import FORMATS, build_report, write_report
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def merge_documents(doc1_path, doc2_path, output_path):
-    logging.info(f"Попытка объединения документов: {doc1_path} и {doc2_path}")
-    
-    if not os.path.exists(doc1_path):
-        raise FileNotFoundError(f"Файл {doc1_path} не найден")
-    if not os.path.exists(doc2_path):
-        raise FileNotFoundError(f"Файл {doc2_path} не найден")
-    
-    doc1 = Document(doc1_path)
-    doc2 = Document(doc2_path)
-
-    #doc1.add_page_break()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Формирование справки по данным АСКЗА")
+    parser.add_argument("--format", dest="formats", nargs="+", choices=FORMATS, default=["docx"],
+                        help="Форматы вывода справки (по умолчанию docx)")
+    parser.add_argument("--profile", nargs="?", const="cprofile", choices=["cprofile", "sample"],
+                        help="Запустить конвейер под профилировщиком (cprofile по умолчанию или sample)")
+    parser.add_argument("--profile-output", default=None,
+                        help="Путь к файлам профиля без расширения (по умолчанию profile в текущей директории)")
+    parser.add_argument("--profile-interval", type=float, default=0.005,
+                        help="Интервал сэмплирования в секундах для --profile sample")
+    return parser.parse_args(argv)
+
+def run_pipeline(base_dir, formats):
+    input_directory_part1 = os.path.join(base_dir, "..", "data", "part1")
+    input_directory_part2 = os.path.join(base_dir, "..", "data", "part2/")
 
-    for element in doc2.element.body:
-        doc1.element.body.append(element)
+    # Один проход анализа на все форматы вывода
+    report = build_report(input_directory_part1, input_directory_part2)
+    return write_report(report, formats, base_dir)
 
-    doc1.save(output_path)
-    logging.info(f"Объединенный документ сохранен как {output_path}")
+def main(argv=None):
+    args = parse_args(argv)
 
-def main():
     base_dir = os.path.dirname(os.path.abspath(__file__))
     logging.info(f"Базовая директория: {base_dir}")
 
-    input_directory_part1 = os.path.join(base_dir, "..", "data", "part1")
-    input_directory_part2 = os.path.join(base_dir, "..", "data", "part2/")
-    
-    output_file_part1 = os.path.join(base_dir, "output.docx")
-    output_file_part2 = os.path.join(base_dir, "result.docx")
-    
-    logging.info(f"Обработка part1 с входной директорией {input_directory_part1}")
-    process_part1(input_directory_part1, output_file_part1)
-    
-    logging.info(f"Обработка part2 с входной директорией {input_directory_part2}")
-    process_part2(input_directory_part2, output_file_part2)
-    
-    logging.info(f"Проверка наличия файла {output_file_part1}: {os.path.exists(output_file_part1)}")
-    logging.info(f"Проверка наличия файла {output_file_part2}: {os.path.exists(output_file_part2)}")
+    if args.profile:
+        from profiler import run_profiled
 
-    merged_output_file = os.path.join(base_dir, "справка.docx")
-    merge_documents(output_file_part1, output_file_part2, merged_output_file)
-    os.remove(output_file_part1)
-    os.remove(output_file_part2)
+        output_prefix = args.profile_output or os.path.join(os.getcwd(), "profile")
+        run_profiled(lambda: run_pipeline(base_dir, args.formats), output_prefix,
+                     mode=args.profile, interval=args.profile_interval)
+    else:
+        run_pipeline(base_dir, args.formats)
     
 if __name__ == "__main__":
-        main()
\ No newline at end of file
+        main()
@@ -0,0 +1,277 @@
+import os
+import sys
+import time
+import marshal
+import cProfile
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Ключ функции в формате pstats: (файл, строка, имя)
+FuncKey = Tuple[str, int, str]
+
+# Этапы конвейера и их входные функции (имя файла, имя функции).
+# Функция относится к ближайшему по цепочке вызовов этапу, поэтому вложенные этапы
+# (custom_round внутри analyze_gas_data) перечислены раньше охватывающих.
+STAGES = [
+    ("Округление (analyzer.custom_round)", [("analyzer.py", "custom_round")]),
+    ("Разбор дат (analyzer.parse_datetime)", [("analyzer.py", "parse_datetime")]),
+    ("Справочник станций (stations.StationIndex)", [("stations.py", "lookup"), ("stations.py", "load_station_index")]),
+    ("Чтение Excel (pd.read_excel)", [("frame_cache.py", "read_excel")]),
+    ("Обработка DataFrame (reader.process_dataframe)", [("reader.py", "process_dataframe")]),
+    ("Анализ (analyzer.analyze_gas_data)", [("analyzer.py", "analyze_gas_data")]),
+    ("Форматирование", [("analyzer.py", "format_results"), ("formatter.py", "format_data")]),
+    ("Анализ part2", [("part2.py", "get_max_excess_details"), ("part2.py", "get_total_excess_details")]),
+    ("Формирование и сохранение docx", [("renderer.py", "render_docx"), ("writer.py", "create_word_document")]),
+    ("Вывод json/txt/html", [("renderer.py", "render_json"), ("renderer.py", "render_text"),
+                             ("renderer.py", "render_html")]),
+]
+
+OTHER_STAGE = "Прочее"
+
+def _stage_entry(func: FuncKey) -> Optional[str]:
+    filename, _, name = func
+    basename = os.path.basename(filename)
+    for stage, entries in STAGES:
+        if (basename, name) in entries:
+            return stage
+    return None
+
+def _label(func: FuncKey) -> str:
+    filename, _, name = func
+    if filename == "~":
+        # Встроенные функции cProfile записывает как ('~', 0, '<built-in method ...>')
+        return name
+    return f"{os.path.basename(filename)}:{name}"
+
+class StackSampler:
+    """
+    Сэмплирующий профилировщик на стандартной библиотеке: фоновый поток
+    периодически снимает стек основного потока.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Dict[Tuple[FuncKey, ...], int] = defaultdict(int)
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def to_stats(self) -> Dict[FuncKey, Any]:
+        """
+        Преобразует сэмплы в словарь формата pstats. Время - число сэмплов,
+        умноженное на интервал; счетчики вызовов - число сэмплов.
+        """
+        self_counts = defaultdict(int)
+        total_counts = defaultdict(int)
+        edges = defaultdict(int)
+        edge_self_counts = defaultdict(int)
+
+        for stack, count in self.samples.items():
+            self_counts[stack[-1]] += count
+            for func in set(stack):
+                total_counts[func] += count
+            for caller, callee in set(zip(stack, stack[1:])):
+                edges[(caller, callee)] += count
+            if len(stack) > 1:
+                edge_self_counts[(stack[-2], stack[-1])] += count
+
+        callers = defaultdict(dict)
+        for (caller, callee), count in edges.items():
+            callers[callee][caller] = (count, count, edge_self_counts[(caller, callee)] * self.interval,
+                                       count * self.interval)
+
+        stats = {}
+        for func, count in total_counts.items():
+            stats[func] = (count, count, self_counts[func] * self.interval,
+                           count * self.interval, callers[func])
+        return stats
+
+    def to_collapsed(self) -> List[str]:
+        """Возвращает строки collapsed-стеков (число сэмплов на стек)."""
+        return [f"{';'.join(_label(func) for func in stack)} {count}"
+                for stack, count in sorted(self.samples.items())]
+
+def collapsed_from_stats(stats: Dict[FuncKey, Any], min_fraction: float = 0.001) -> List[str]:
+    """
+    Строит collapsed-стеки из графа вызовов cProfile. Время функции распределяется
+    по вызывающим пропорционально cumulative time соответствующих ребер, поэтому
+    результат приближенный. Значения - микросекунды.
+
+    :param stats: Словарь pstats.Stats.stats
+    :param min_fraction: Поддеревья меньше этой доли общего времени отбрасываются
+    :return: Список строк "f1;f2;f3 значение"
+    """
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, func_callers) in stats.items():
+        for caller, edge in func_callers.items():
+            callees[caller][func] = edge[3]
+
+    roots = [func for func, value in stats.items() if not value[4]]
+    total = sum(stats[func][3] for func in roots) or 1.0
+    threshold = total * min_fraction
+    collapsed = defaultdict(float)
+
+    def walk(func, stack, budget):
+        cumulative = stats[func][3]
+        if budget < threshold or cumulative <= 0:
+            return
+        fraction = min(budget / cumulative, 1.0)
+        collapsed[";".join(_label(f) for f in stack)] += stats[func][2] * fraction
+        for callee, edge_time in callees[func].items():
+            if callee not in stack:
+                walk(callee, stack + [callee], edge_time * fraction)
+
+    for root in roots:
+        walk(root, [root], stats[root][3])
+
+    return [f"{stack} {int(value * 1e6)}" for stack, value in sorted(collapsed.items())
+            if int(value * 1e6) > 0]
+
+def _stage_of(func: FuncKey, stats: Dict[FuncKey, Any], cache: Dict[FuncKey, str]) -> str:
+    """
+    Определяет этап функции, поднимаясь по основной цепочке вызывающих.
+    Рекурсивные вызовы (ребра на себя и на функции, уже пройденные в цепочке)
+    пропускаются, чтобы рекурсия не обрывала подъем.
+    """
+    chain = []
+    current = func
+    stage = OTHER_STAGE
+    while current is not None:
+        if current in cache:
+            stage = cache[current]
+            break
+        chain.append(current)
+        entry = _stage_entry(current)
+        if entry:
+            stage = entry
+            break
+        func_callers = stats[current][4] if current in stats else {}
+        candidates = [caller for caller in func_callers if caller not in chain]
+        current = max(candidates, key=lambda c: func_callers[c][3]) if candidates else None
+
+    for item in chain:
+        cache[item] = stage
+    return stage
+
+def _split_by_stage(func: FuncKey, stats: Dict[FuncKey, Any],
+                    cache: Dict[FuncKey, str]) -> Dict[str, Tuple[float, int]]:
+    """
+    Распределяет собственное время и число вызовов функции по этапам вызывающих
+    пропорционально весам ребер (собственное время по ребру, иначе cumulative time).
+    Нужно для общих функций вроде isinstance, которые вызываются из разных этапов.
+
+    :return: Словарь, где ключ - этап, значение - (собственное время, число вызовов)
+    """
+    _, nc, tt, _, func_callers = stats[func]
+    edges = {caller: edge for caller, edge in func_callers.items() if caller != func}
+    entry = _stage_entry(func)
+    if entry or not edges:
+        return {entry or _stage_of(func, stats, cache): (tt, nc)}
+
+    weights = {caller: edge[2] for caller, edge in edges.items()}
+    if not sum(weights.values()):
+        weights = {caller: edge[3] for caller, edge in edges.items()}
+    if not sum(weights.values()):
+        weights = {caller: 1.0 for caller in edges}
+    total_weight = sum(weights.values())
+
+    shares = defaultdict(lambda: [0.0, 0])
+    for caller, edge in edges.items():
+        share = shares[_stage_of(caller, stats, cache)]
+        share[0] += tt * weights[caller] / total_weight
+        share[1] += edge[1]
+    return {stage: (share_tt, share_nc) for stage, (share_tt, share_nc) in shares.items()}
+
+def summarize_by_stage(stats: Dict[FuncKey, Any], top: int = 5, count_label: str = "выз.") -> str:
+    """
+    Формирует сводку: собственное время по этапам конвейера и самые
+    затратные функции внутри каждого этапа.
+
+    :param stats: Словарь pstats.Stats.stats
+    :param top: Число функций на этап
+    :param count_label: Подпись счетчика ("выз." для cProfile, "сэмпл." для сэмплирования)
+    :return: Текст сводки
+    """
+    cache = {}
+    by_stage = defaultdict(list)
+    for func, (_, _, _, ct, _) in stats.items():
+        for stage, (tt, nc) in _split_by_stage(func, stats, cache).items():
+            by_stage[stage].append((tt, ct, nc, func))
+
+    total = sum(item[0] for items in by_stage.values() for item in items) or 1.0
+    stage_totals = sorted(((sum(item[0] for item in items), stage) for stage, items in by_stage.items()),
+                          reverse=True)
+
+    lines = [f"Всего: {total:.3f} с"]
+    for stage_time, stage in stage_totals:
+        lines.append(f"{stage}: {stage_time:.3f} с ({stage_time / total:.1%})")
+        for tt, ct, nc, func in sorted(by_stage[stage], key=lambda item: item[0], reverse=True)[:top]:
+            lines.append(f"    {tt:8.3f} с собств. {ct:8.3f} с всего {nc:8d} {count_label:7s} {_label(func)}")
+    return "\n".join(lines)
+
+def run_profiled(func: Callable[[], Any], output_prefix: str, mode: str = "cprofile",
+                 interval: float = 0.005, top: int = 5) -> Any:
+    """
+    Выполняет функцию под профилировщиком, сохраняет pstats и collapsed-стеки
+    и печатает сводку по этапам конвейера.
+
+    :param func: Профилируемая функция без аргументов
+    :param output_prefix: Путь к файлам результатов без расширения
+    :param mode: "cprofile" или "sample"
+    :param interval: Интервал сэмплирования в секундах для режима "sample"
+    :param top: Число функций на этап в сводке
+    :return: Результат функции
+    """
+    start = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        result = profiler.runcall(func)
+        profiler.create_stats()
+        stats = profiler.stats
+        collapsed = collapsed_from_stats(stats)
+    elif mode == "sample":
+        sampler = StackSampler(interval)
+        sampler.start()
+        try:
+            result = func()
+        finally:
+            sampler.stop()
+        stats = sampler.to_stats()
+        collapsed = sampler.to_collapsed()
+    else:
+        raise ValueError(f"Неизвестный режим профилирования: {mode}")
+    elapsed = time.perf_counter() - start
+
+    pstats_file = f"{output_prefix}.pstats"
+    with open(pstats_file, "wb") as f:
+        marshal.dump(stats, f)
+    collapsed_file = f"{output_prefix}.collapsed"
+    with open(collapsed_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(collapsed) + "\n")
+
+    logging.info(f"Профиль ({mode}) сохранен: {pstats_file}, {collapsed_file}")
+    print(f"Профиль конвейера ({mode}), время выполнения {elapsed:.3f} с")
+    print(summarize_by_stage(stats, top, count_label="сэмпл." if mode == "sample" else "выз."))
+    return result
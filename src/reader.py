@@ -2,42 +2,21 @@ import os
 import pandas as pd
 import logging
 from typing import Dict, Any
-import re
+from frame_cache import read_excel
+from stations import get_station_index
 
 # Настройка логирования
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def simplify_station_name(station_name: str) -> str:
     """
-    Упрощает название станции, обрабатывая специальные случаи и удаляя ненужные обозначения.
+    Упрощает название станции по справочнику станций, для отсутствующих
+    в справочнике станций удаляет ненужные обозначения.
     
     :param station_name: Исходное название станции
     :return: Упрощенное название станции
     """
-    # Словарь специальных случаев
-    special_cases = {
-        "М2 (Жулебино) (С)": "Жулебино",
-        "М1 (Очаковское) (С)": "Очаковское",
-        "М (Балашиха-Речная) ()": "Балашиха-Речная",
-        "МКАД 105 восток (Сп)": "МКАД 105 восток",
-        "МКАД 52 запад (Сп)": "МКАД 52 запад"
-    }
-
-    # Проверяем, является ли станция специальным случаем
-    if station_name in special_cases:
-        return special_cases[station_name]
-
-    # Общая обработка для остальных случаев
-    # Удаляем обозначения в скобках: (С), (Ж), (А), (Сп), ()
-    station_name = re.sub(r'\s*\([СЖСА]?п?\)\s*', '', station_name)
-    
-    # Удаляем пустые скобки
-    station_name = re.sub(r'\s*\(\)\s*', '', station_name)
-    
-    # Если название начинается с "М1 " или "М2 ", удаляем эту часть
-    station_name = re.sub(r'^М[12]?\s+\(([^)]+)\)', r'\1', station_name)
-
-    return station_name.strip()
+    return get_station_index().display_name(station_name)
 
 def read_excel_files(directory: str) -> Dict[str, pd.DataFrame]:
     """
@@ -65,7 +44,7 @@ def read_excel_files(directory: str) -> Dict[str, pd.DataFrame]:
         gas_name = os.path.splitext(file)[0]
         
         try:
-            df = pd.read_excel(file_path)
+            df = read_excel(file_path)
             processed_df = process_dataframe(df, gas_name)
             if not processed_df.empty:
                 data_dict[gas_name] = processed_df
@@ -101,11 +80,9 @@ def process_dataframe(df: pd.DataFrame, gas_name: str) -> pd.DataFrame:
     # Фильтрация данных
     df = df[df["Макс раз знач (в ПДКмр)"] > 1.00]
     
-    # Добавление категории станции и упрощение названий
-    mo_stations = ["МО", "Звенигород", "Балашиха-Салтыковка", "Реутов-2", "М (Балашиха-Речная)"]
-    df["Категория"] = df["Станция"].apply(lambda x: "Московская область" if any(station in x for station in mo_stations) else "Москва")
-    
-    # Упрощение названий станций
-    df["Станция"] = df["Станция"].apply(lambda x: simplify_station_name(x))
+    # Добавление категории станции и упрощение названий по справочнику станций
+    station_index = get_station_index()
+    df["Категория"] = df["Станция"].map(station_index.region)
+    df["Станция"] = df["Станция"].map(station_index.display_name)
     
     return df[required_columns + ["Категория"]]
\ No newline at end of file
@@ -0,0 +1,150 @@
+import os
+import json
+import html
+import logging
+from typing import Any, Dict, Iterable
+from reader import read_excel_files
+from analyzer import analyze_data, format_results
+from formatter import format_data, format_part2_lines, line_runs, part2_titles
+from part2 import analyze_part2
+
+# Настройка логирования
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+TITLE = "Данные АСКЗА"
+
+def build_report(input_directory_part1: str, input_directory_part2: str) -> Dict[str, Any]:
+    """
+    Выполняет один проход анализа part1 и part2 и возвращает результаты,
+    общие для всех форматов вывода.
+
+    :param input_directory_part1: Путь к директории с Excel файлами part1
+    :param input_directory_part2: Путь к директории с Excel файлами part2 (с завершающим разделителем)
+    :return: Словарь с ключами "part1" (анализ и текст) и "part2" (разделы длительностей)
+    """
+    logging.info(f"Обработка part1 с входной директорией {input_directory_part1}")
+    data = read_excel_files(input_directory_part1)
+
+    analysis_results = analyze_data(data) if data else {}
+    formatted_results = format_data(format_results(analysis_results)) if analysis_results else None
+    if formatted_results is None:
+        logging.warning("Нет данных для анализа part1")
+
+    logging.info(f"Обработка part2 с входной директорией {input_directory_part2}")
+    part2_results = analyze_part2(input_directory_part2)
+
+    return {
+        "part1": {
+            "анализ": analysis_results,
+            "текст": formatted_results
+        },
+        "part2": part2_results
+    }
+
+def render_text(report: Dict[str, Any]) -> str:
+    """Формирует справку в виде простого текста."""
+    lines = [TITLE]
+    if report["part1"]["текст"]:
+        lines.extend(report["part1"]["текст"].splitlines())
+    lines.extend(line for line, _ in format_part2_lines(report["part2"]))
+    return "\n".join(lines) + "\n"
+
+def render_json(report: Dict[str, Any]) -> str:
+    """
+    Формирует справку в формате JSON для дашборда: только данные анализа,
+    без текста и оформления справки.
+
+    part1 - результаты analyzer.analyze_data по газам и категориям,
+    part2 - разделы "max_continuous" и "max_total" из part2.analyze_part2.
+    """
+    data = {
+        "part1": report["part1"]["анализ"],
+        "part2": {section: report["part2"].get(section, []) for section in part2_titles}
+    }
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+def _render_html_line(line: str) -> str:
+    """Размечает строку part1 по тем же правилам, что и документ Word."""
+    fragments = []
+    for text, bold, italic in line_runs(line):
+        fragment = html.escape(text)
+        if italic:
+            fragment = f"<i>{fragment}</i>"
+        if bold:
+            fragment = f"<b>{fragment}</b>"
+        if text:
+            fragments.append(fragment)
+    return "".join(fragments)
+
+def render_html(report: Dict[str, Any]) -> str:
+    """Формирует справку в формате HTML."""
+    paragraphs = [f"<p><b><u>{html.escape(TITLE)}</u></b></p>"]
+    if report["part1"]["текст"]:
+        for line in report["part1"]["текст"].splitlines():
+            paragraphs.append(f"<p>{_render_html_line(line)}</p>")
+    for line, is_heading in format_part2_lines(report["part2"]):
+        text = html.escape(line)
+        paragraphs.append(f"<p><b>{text}</b></p>" if is_heading else f"<p>{text}</p>")
+
+    body = "\n".join(paragraphs)
+    return (
+        "<!DOCTYPE html>\n"
+        "<html lang=\"ru\">\n"
+        "<head>\n"
+        "<meta charset=\"utf-8\">\n"
+        f"<title>{html.escape(TITLE)}</title>\n"
+        "<style>body { font-family: 'Times New Roman', serif; font-size: 14pt; } p { margin: 0; }</style>\n"
+        "</head>\n"
+        f"<body>\n{body}\n</body>\n"
+        "</html>\n"
+    )
+
+def render_docx(report: Dict[str, Any], output):
+    """
+    Формирует справку в формате Word.
+
+    :param report: Результаты build_report
+    :param output: Путь к файлу или файловый объект для сохранения документа
+    """
+    # python-docx импортируется только при выводе в docx
+    from writer import build_word_document, add_part2_results
+
+    document = build_word_document(report["part1"]["текст"])
+    add_part2_results(document, report["part2"])
+    document.save(output)
+
+TEXT_RENDERERS = {
+    "json": render_json,
+    "txt": render_text,
+    "html": render_html
+}
+
+FORMATS = ("docx",) + tuple(TEXT_RENDERERS)
+
+def write_report(report: Dict[str, Any], formats: Iterable[str], output_dir: str,
+                 base_name: str = "справка") -> Dict[str, str]:
+    """
+    Сохраняет справку во всех запрошенных форматах.
+
+    :param report: Результаты build_report
+    :param formats: Форматы вывода из FORMATS
+    :param output_dir: Директория для сохранения файлов
+    :param base_name: Имя файлов без расширения
+    :return: Словарь, где ключ - формат, значение - путь к сохраненному файлу
+    """
+    output_files = {}
+    for fmt in dict.fromkeys(formats):
+        if fmt not in FORMATS:
+            raise ValueError(f"Неизвестный формат вывода: {fmt}")
+
+        output_file = os.path.join(output_dir, f"{base_name}.{fmt}")
+        if fmt == "docx":
+            render_docx(report, output_file)
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write(TEXT_RENDERERS[fmt](report))
+
+        logging.info(f"Справка в формате {fmt} сохранена: {output_file}")
+        output_files[fmt] = output_file
+
+    return output_files
@@ -0,0 +1,169 @@
+import io
+import os
+import argparse
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, quote, urlparse
+from frame_cache import enable_frame_cache
+from renderer import FORMATS, TEXT_RENDERERS, build_report, render_docx
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+CONTENT_TYPES = {
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "json": "application/json; charset=utf-8",
+    "txt": "text/plain; charset=utf-8",
+    "html": "text/html; charset=utf-8"
+}
+
+CHUNK_SIZE = 64 * 1024
+
+class ReportService:
+    """
+    Формирует справки по запросу в пуле потоков с ограничением параллельности.
+    Одинаковые одновременные запросы объединяются в одно вычисление.
+    """
+
+    def __init__(self, data_root: str, max_workers: int = 2):
+        self.data_root = os.path.abspath(data_root)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+
+    def resolve_directory(self, directory: str) -> str:
+        """
+        Возвращает абсолютный путь к директории с данными внутри data_root.
+
+        :param directory: Путь относительно data_root (например, дата)
+        :return: Абсолютный путь к директории, содержащей part1 и part2
+        """
+        if not directory:
+            raise ValueError("Не указана директория с данными (параметр dir)")
+        path = os.path.abspath(os.path.join(self.data_root, directory))
+        if os.path.commonpath([self.data_root, path]) != self.data_root:
+            raise ValueError(f"Директория вне корня данных: {directory}")
+        if not os.path.isdir(path):
+            raise FileNotFoundError(f"Директория не найдена: {directory}")
+        # Без part1 и part2 получилась бы справка из одного заголовка
+        if not any(os.path.isdir(os.path.join(path, part)) for part in ("part1", "part2")):
+            raise FileNotFoundError(f"В директории {directory} нет part1 и part2")
+        return path
+
+    def _generate(self, path: str, fmt: str) -> bytes:
+        input_directory_part1 = os.path.join(path, "part1")
+        input_directory_part2 = os.path.join(path, "part2", "")
+        report = build_report(input_directory_part1, input_directory_part2)
+
+        if fmt == "docx":
+            buffer = io.BytesIO()
+            render_docx(report, buffer)
+            return buffer.getvalue()
+        return TEXT_RENDERERS[fmt](report).encode("utf-8")
+
+    def _forget(self, key: Tuple[str, str]):
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def generate(self, directory: str, fmt: str = "docx") -> bytes:
+        """
+        Формирует справку для директории в указанном формате.
+
+        :param directory: Путь относительно data_root
+        :param fmt: Формат вывода из renderer.FORMATS
+        :return: Содержимое справки
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Неизвестный формат вывода: {fmt}")
+        path = self.resolve_directory(directory)
+
+        key = (path, fmt)
+        with self._lock:
+            future = self._in_flight.get(key)
+            created = future is None
+            if created:
+                future = self._executor.submit(self._generate, path, fmt)
+                self._in_flight[key] = future
+
+        if created:
+            # Колбэк может выполниться сразу в этом потоке, поэтому регистрируется вне блокировки
+            future.add_done_callback(lambda _: self._forget(key))
+        else:
+            logging.info(f"Запрос объединен с выполняющимся: {directory} ({fmt})")
+        return future.result()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+class ReportRequestHandler(BaseHTTPRequestHandler):
+    """Обрабатывает GET /report?dir=<директория>&format=<формат>."""
+
+    service: ReportService = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/report":
+            self.send_error(404, explain="Неизвестный путь")
+            return
+
+        params = parse_qs(url.query)
+        directory = params.get("dir", [""])[0]
+        fmt = params.get("format", ["docx"])[0]
+
+        # Строка статуса HTTP допускает только latin-1, поэтому текст ошибки передается в теле ответа
+        try:
+            content = self.service.generate(directory, fmt)
+        except ValueError as e:
+            self.send_error(400, explain=str(e))
+            return
+        except FileNotFoundError as e:
+            self.send_error(404, explain=str(e))
+            return
+        except Exception as e:
+            logging.error(f"Ошибка при формировании справки: {str(e)}")
+            self.send_error(500, explain="Ошибка при формировании справки")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES[fmt])
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{quote(f'справка.{fmt}')}")
+        self.end_headers()
+        for start in range(0, len(content), CHUNK_SIZE):
+            self.wfile.write(content[start:start + CHUNK_SIZE])
+
+    def log_message(self, format, *args):
+        logging.info(f"{self.address_string()} - {format % args}")
+
+def parse_args(argv=None):
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="HTTP сервис формирования справки по данным АСКЗА")
+    parser.add_argument("--host", default="127.0.0.1", help="Адрес для прослушивания")
+    parser.add_argument("--port", type=int, default=8000, help="Порт для прослушивания")
+    parser.add_argument("--data-root", default=os.path.join(base_dir, "..", "data"),
+                        help="Корневая директория с данными (поддиректории содержат part1 и part2)")
+    parser.add_argument("--workers", type=int, default=2, help="Максимальное число одновременных формирований")
+    parser.add_argument("--cache-size", type=int, default=64, help="Число Excel файлов в кэше")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    enable_frame_cache(args.cache_size)
+    service = ReportService(args.data_root, max_workers=args.workers)
+    ReportRequestHandler.service = service
+
+    server = ThreadingHTTPServer((args.host, args.port), ReportRequestHandler)
+    logging.info(f"Сервис запущен на http://{args.host}:{args.port}/report, корень данных: {service.data_root}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Остановка сервиса")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import os
+import re
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+STATIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stations.json")
+
+# Версии файла справочника с поддерживаемой структурой
+SUPPORTED_VERSIONS = (1, 2)
+
+MOSCOW = "Москва"
+MOSCOW_REGION = "Московская область"
+
+# Правила упрощения названий для станций, отсутствующих в справочнике
+# Удаляем обозначения типа станции в скобках: (С), (Ж), (А), (Сп), (П), (Высо), ()
+_STATION_CODE_RE = re.compile(r'\s*\((?:[СЖСА]?п?|П|Высо)\)\s*')
+# Удаляем пустые скобки
+_EMPTY_BRACKETS_RE = re.compile(r'\s*\(\)\s*')
+# Если название начинается с "М1 " или "М2 ", удаляем эту часть
+_NUMBERED_PREFIX_RE = re.compile(r'^М[12]?\s+\(([^)]+)\)')
+# Тип станции - обозначение в последних скобках
+_STATION_TYPE_RE = re.compile(r'\(([^()]*)\)\s*$')
+
+class StationIndex:
+    """Справочник станций: исходное название -> отображаемое название, регион и тип."""
+
+    def __init__(self, stations: List[Dict[str, str]], mo_markers: List[str], version: int):
+        self.version = version
+        self._stations = {station["raw_name"]: station for station in stations}
+        self._mo_pattern = re.compile("|".join(re.escape(marker) for marker in mo_markers))
+        self._fallback = {}
+
+    def __len__(self):
+        return len(self._stations)
+
+    def __contains__(self, raw_name: str) -> bool:
+        return raw_name in self._stations
+
+    def _build_fallback(self, raw_name: str) -> Dict[str, str]:
+        display_name = _STATION_CODE_RE.sub('', raw_name)
+        display_name = _EMPTY_BRACKETS_RE.sub('', display_name)
+        display_name = _NUMBERED_PREFIX_RE.sub(r'\1', display_name)
+
+        type_match = _STATION_TYPE_RE.search(raw_name)
+        logging.warning(f"Станция отсутствует в справочнике {STATIONS_FILE}: {raw_name}")
+        return {
+            "raw_name": raw_name,
+            "display_name": display_name.strip(),
+            "region": MOSCOW_REGION if self._mo_pattern.search(raw_name) else MOSCOW,
+            "station_type": type_match.group(1) if type_match else ""
+        }
+
+    def lookup(self, raw_name: str) -> Dict[str, str]:
+        """
+        Возвращает сведения о станции из справочника, а для неизвестных
+        станций - результат общих правил (вычисляется один раз на название).
+
+        :param raw_name: Название станции в исходных данных
+        :return: Словарь с ключами raw_name, display_name, region, station_type
+        """
+        station = self._stations.get(raw_name)
+        if station is None:
+            station = self._fallback.get(raw_name)
+            if station is None:
+                station = self._fallback[raw_name] = self._build_fallback(raw_name)
+        return station
+
+    def display_name(self, raw_name: str) -> str:
+        return self.lookup(raw_name)["display_name"]
+
+    def region(self, raw_name: str) -> str:
+        return self.lookup(raw_name)["region"]
+
+    def station_type(self, raw_name: str) -> str:
+        return self.lookup(raw_name)["station_type"]
+
+def load_station_index(path: str = STATIONS_FILE) -> StationIndex:
+    """
+    Загружает справочник станций из JSON файла.
+
+    :param path: Путь к файлу справочника
+    :return: Справочник станций
+    :raises ValueError: Если версия файла не поддерживается
+    """
+    with open(path, encoding="utf-8") as f:
+        data: Dict[str, Any] = json.load(f)
+
+    version = data.get("version")
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError(f"Неподдерживаемая версия справочника станций {path}: {version}")
+
+    index = StationIndex(data["stations"], data["fallback_mo_markers"], data["version"])
+    logging.info(f"Загружен справочник станций версии {index.version}: {len(index)} станций")
+    return index
+
+@lru_cache(maxsize=None)
+def get_station_index() -> StationIndex:
+    """Возвращает справочник станций, загружаемый один раз на процесс."""
+    return load_station_index()
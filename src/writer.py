@@ -1,16 +1,18 @@
 import logging
+from typing import Any, Dict, List, Optional
+from formatter import format_part2_lines, line_runs
 from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def create_word_document(formatted_results: str, output_file: str):
+def build_word_document(formatted_results: Optional[str]):
     """
-    Создает документ Word на основе отформатированных результатов.
+    Создает документ Word в памяти на основе отформатированных результатов.
 
-    :param formatted_results: Отформатированная строка с результатами
-    :param output_file: Путь для сохранения документа Word
+    :param formatted_results: Отформатированная строка с результатами (None - только заголовок)
+    :return: Документ Word
     """
     doc = Document()
 
@@ -30,46 +32,53 @@ def create_word_document(formatted_results: str, output_file: str):
     title_run.font.size = Pt(14)
     title.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
 
-    for line in formatted_results.splitlines():
+    for line in (formatted_results or "").splitlines():
         p = doc.add_paragraph()
-        if line == "Превышения ПДКмр:":  # Делаем заголовок жирным
-            run = p.add_run(line)
-            run.bold = True
-        elif line in ("Москва", "Московская область"):
-            run = p.add_run(line)
-            run.italic = True
-            run.bold = True
-        else:
-            # Проверяем, является ли строка подзаголовком с "по {вещество} на"
-            if line.startswith("по ") and " АСКЗА:" in line: 
-                parts = line.split(" АСКЗА:")
-                run = p.add_run(parts[0] + " АСКЗА:")
+        for text, bold, italic in line_runs(line):
+            run = p.add_run(text)
+            if italic:
+                run.italic = True
+            if bold:
                 run.bold = True
-                if len(parts) > 1:
-                    run = p.add_run(parts[1])
-            else:
-                parts = line.split('на уровне 1 ПДКмр ')
-                if len(parts) > 1:
-                    run = p.add_run(parts[0])
-                    run = p.add_run('на уровне 1 ПДКмр ')
-                    run.bold = True
-                    run = p.add_run(parts[1])
-                else:
-                    parts = line.split("до ")
-                    if len(parts) > 1:
-                        run = p.add_run(parts[0])
-                        run = p.add_run(f"до {parts[1].split(' ПДКмр ')[0]} ПДКмр ")
-                        run.bold = True
-                        run = p.add_run(parts[1].split(' ПДКмр ')[1])
-                    else:
-                        run = p.add_run(line)
 
         p.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
 
+    return doc
+
+def create_word_document(formatted_results: str, output_file: str):
+    """
+    Создает документ Word на основе отформатированных результатов.
+
+    :param formatted_results: Отформатированная строка с результатами
+    :param output_file: Путь для сохранения документа Word
+    """
+    doc = build_word_document(formatted_results)
+
     # Сохранение документа
     doc.save(output_file)
     logging.info(f"Документ Word сохранен: {output_file}")
 
+def add_custom_text(document, text, font_name='Times New Roman', font_size=14, bold=False):
+    """Добавляет заголовок с указанным шрифтом, размером и жирным стилем."""
+    heading = document.add_paragraph()
+    heading.paragraph_format.space_after = Pt(0)
+    heading.paragraph_format.space_before = Pt(0)
+    run = heading.add_run(text)
+    run.font.name = font_name
+    run.font.size = Pt(font_size)
+    if bold:
+        run.bold = True
+
+def add_part2_results(document, part2_results: Dict[str, List[Dict[str, Any]]]):
+    """
+    Записывает результаты part2 (длительности превышений) в документ.
+
+    :param document: Документ Word
+    :param part2_results: Результаты part2.analyze_part2
+    """
+    for text, is_heading in format_part2_lines(part2_results):
+        add_custom_text(document, text, font_name='Times New Roman', font_size=14, bold=is_heading)
+
 def main(formatted_results: str, output_file: str):
     """
     Основная функция для создания документа Word.
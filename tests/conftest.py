@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Модули проекта импортируют друг друга без пакета, как при запуске из src
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
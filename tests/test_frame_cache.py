@@ -0,0 +1,60 @@
+import os
+import pandas as pd
+import pytest
+import frame_cache
+from frame_cache import FrameCache
+
+@pytest.fixture
+def fake_read_excel(monkeypatch):
+    """Подменяет pd.read_excel без чтения файлов и возвращает список прочитанных путей."""
+    reads = []
+
+    def read_excel(file_path, *args, **kwargs):
+        reads.append(file_path)
+        return pd.DataFrame({"Станция": [os.path.basename(file_path)]})
+
+    monkeypatch.setattr(frame_cache.pd, "read_excel", read_excel)
+    return reads
+
+def test_frame_cache_evicts_least_recently_used(tmp_path, fake_read_excel):
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.xlsx"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    a, b, c = paths
+
+    cache = FrameCache(maxsize=2)
+    cache.read_excel(a)
+    cache.read_excel(b)
+    cache.read_excel(a)
+    cache.read_excel(c)
+    assert fake_read_excel == [a, b, c]
+
+    cache.read_excel(a)
+    assert fake_read_excel == [a, b, c]
+    cache.read_excel(b)
+    assert fake_read_excel == [a, b, c, b]
+
+def test_frame_cache_rereads_changed_file(tmp_path, fake_read_excel):
+    path = tmp_path / "H2S.xlsx"
+    path.write_bytes(b"")
+    cache = FrameCache()
+
+    cache.read_excel(str(path))
+    cache.read_excel(str(path))
+    assert len(fake_read_excel) == 1
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.read_excel(str(path))
+    assert len(fake_read_excel) == 2
+
+def test_frame_cache_returns_copies(tmp_path, fake_read_excel):
+    path = tmp_path / "NO.xlsx"
+    path.write_bytes(b"")
+    cache = FrameCache()
+
+    df = cache.read_excel(str(path))
+    df["Регион"] = "Москва"
+    assert "Регион" not in cache.read_excel(str(path)).columns
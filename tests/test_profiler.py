@@ -0,0 +1,35 @@
+from profiler import OTHER_STAGE, summarize_by_stage, _split_by_stage, _stage_of
+
+READ = ("/src/frame_cache.py", 1, "read_excel")
+PART2 = ("/src/part2.py", 1, "get_max_excess_details")
+BUILD = ("/src/renderer.py", 1, "build_report")
+FROM_TREE = ("/openpyxl/descriptors/serialisable.py", 1, "from_tree")
+SET = ("/openpyxl/descriptors/base.py", 1, "__set__")
+ISINSTANCE = ("~", 0, "<built-in method builtins.isinstance>")
+
+# (cc, nc, tt, ct, callers); ребро вызывающего: (cc, nc, tt, ct)
+STATS = {
+    BUILD: (1, 1, 0.0, 1.0, {}),
+    READ: (1, 1, 0.0, 0.8, {BUILD: (1, 1, 0.0, 0.8)}),
+    PART2: (1, 1, 0.0, 0.2, {BUILD: (1, 1, 0.0, 0.2)}),
+    # Рекурсия: самый затратный вызывающий from_tree - он сам
+    FROM_TREE: (10, 100, 0.3, 0.7, {READ: (10, 10, 0.05, 0.5), FROM_TREE: (90, 90, 0.25, 0.9)}),
+    SET: (50, 50, 0.1, 0.1, {FROM_TREE: (50, 50, 0.1, 0.1)}),
+    ISINSTANCE: (400, 400, 0.4, 0.4, {FROM_TREE: (300, 300, 0.3, 0.3), PART2: (100, 100, 0.1, 0.1)}),
+}
+
+def test_recursive_function_keeps_caller_stage():
+    cache = {}
+    assert _stage_of(FROM_TREE, STATS, cache) == "Чтение Excel (pd.read_excel)"
+    assert _stage_of(SET, STATS, cache) == "Чтение Excel (pd.read_excel)"
+    assert _stage_of(BUILD, STATS, cache) == OTHER_STAGE
+
+def test_shared_function_time_is_split_by_caller_stage():
+    shares = _split_by_stage(ISINSTANCE, STATS, {})
+    assert abs(shares["Чтение Excel (pd.read_excel)"][0] - 0.3) < 1e-9
+    assert abs(shares["Анализ part2"][0] - 0.1) < 1e-9
+    assert shares["Анализ part2"][1] == 100
+
+def test_summary_labels_samples():
+    assert "сэмпл." in summarize_by_stage(STATS, count_label="сэмпл.")
+    assert "выз." not in summarize_by_stage(STATS, count_label="сэмпл.")
@@ -0,0 +1,115 @@
+import io
+import os
+import sys
+import json
+import subprocess
+import pandas as pd
+import pytest
+from renderer import build_report, render_docx, render_html, render_json, render_text
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+EXPECTED_TEXT = """Данные АСКЗА
+Превышения ПДКмр:
+Москва
+по сероводороду на 1 АСКЗА:
+до 2.7 ПДКмр в 20:00 21.10.2024 (Гурьянова);
+Московская область
+по сероводороду на 1 АСКЗА:
+на уровне 1 ПДКмр в 09:00 21.10.2024 (МО-Мытищи).
+Максимальная непрерывная длительность превышений:
+по сероводороду – 40 минут с 19:20 до 20:00 21.10.2024 (Гурьянова), 20 минут с 08:40 до 09:00 21.10.2024 (МО-Мытищи).
+Максимальная общая длительность превышений:
+по сероводороду – 40 минут (Гурьянова), 20 минут (МО-Мытищи).
+"""
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    root = tmp_path_factory.mktemp("data")
+    (root / "part1").mkdir()
+    (root / "part2").mkdir()
+    pd.DataFrame({
+        "Станция": ["Гурьянова (С)", "МО-Мытищи ()", "Люблино (С)"],
+        "Макс раз знач (в ПДКмр)": [2.74, 1.04, 0.5],
+        "Макс раз знач (дата и вр)": ["21/10/2024 20:00", "21/10/2024 09:00", "21/10/2024 10:00"],
+    }).to_excel(root / "part1" / "H2S.xlsx", index=False)
+    pd.DataFrame({
+        "Станция": ["Гурьянова", "МО-Мытищи"],
+        "Число часов": [0, 0],
+        "Количество точек": [2, 1],
+        "Период превышения С": ["21/10/2024 19:40", "21/10/2024 09:00"],
+        "Период превышения ПО": ["21/10/2024 20:00", "21/10/2024 09:00"],
+    }).to_excel(root / "part2" / "H2S_п.xlsx", index=False)
+    return root
+
+@pytest.fixture(scope="module")
+def report(data_dir):
+    return build_report(str(data_dir / "part1"), os.path.join(str(data_dir / "part2"), ""))
+
+def test_render_text(report):
+    assert render_text(report) == EXPECTED_TEXT
+
+def test_render_html(report):
+    rendered = render_html(report)
+    assert "<p><b><u>Данные АСКЗА</u></b></p>" in rendered
+    assert "<p><b><i>Москва</i></b></p>" in rendered
+    assert "<p><b>по сероводороду на 1 АСКЗА:</b></p>" in rendered
+    assert "<p><b>до 2.7 ПДКмр </b>в 20:00 21.10.2024 (Гурьянова);</p>" in rendered
+    assert "<p><b>на уровне 1 ПДКмр </b>в 09:00 21.10.2024 (МО-Мытищи).</p>" in rendered
+    assert "<p><b>Максимальная общая длительность превышений:</b></p>" in rendered
+    assert "<p>по сероводороду – 40 минут (Гурьянова), 20 минут (МО-Мытищи).</p>" in rendered
+
+def test_render_json(report):
+    data = json.loads(render_json(report))
+    assert data == {
+        "part1": {
+            "H2S": {
+                "Москва": {
+                    "количество_станций": 1,
+                    "превышения": [{"пдкмр": 2.7, "станции": ["в 20:00 21.10.2024 (Гурьянова)"]}]
+                },
+                "Московская область": {
+                    "количество_станций": 1,
+                    "превышения": [{"пдкмр": 1.0, "станции": ["в 09:00 21.10.2024 (МО-Мытищи)"]}]
+                }
+            }
+        },
+        "part2": {
+            "max_continuous": [{
+                "газ": "H2S",
+                "название": "сероводороду",
+                "детали": "40 минут с 19:20 до 20:00 21.10.2024 (Гурьянова), "
+                          "20 минут с 08:40 до 09:00 21.10.2024 (МО-Мытищи)"
+            }],
+            "max_total": [{
+                "газ": "H2S",
+                "название": "сероводороду",
+                "детали": "40 минут (Гурьянова), 20 минут (МО-Мытищи)"
+            }]
+        }
+    }
+
+def test_render_docx_matches_text(report):
+    from docx import Document
+
+    buffer = io.BytesIO()
+    render_docx(report, buffer)
+    buffer.seek(0)
+    paragraphs = Document(buffer).paragraphs
+
+    assert [p.text for p in paragraphs] == EXPECTED_TEXT.splitlines()
+    bold_runs = [run.text for run in paragraphs[4].runs if run.bold]
+    assert bold_runs == ["до 2.7 ПДКмр "]
+
+def test_text_formats_do_not_import_docx(data_dir, tmp_path):
+    # Отдельный процесс: в текущем python-docx уже мог быть импортирован другими тестами
+    code = f"""
+import sys
+sys.path.insert(0, {SRC_DIR!r})
+from renderer import build_report, write_report
+report = build_report({str(data_dir / "part1")!r}, {os.path.join(str(data_dir / "part2"), "")!r})
+files = write_report(report, ["json", "txt", "html"], {str(tmp_path)!r})
+assert sorted(files) == ["html", "json", "txt"], files
+assert not any(name == "docx" or name.startswith("docx.") for name in sys.modules)
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,130 @@
+import os
+import time
+import threading
+import pandas as pd
+import pytest
+import frame_cache
+from frame_cache import enable_frame_cache
+from server import ReportService
+
+DATA_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+@pytest.fixture
+def excel_reads(monkeypatch):
+    """Подменяет pd.read_excel и возвращает список прочитанных путей."""
+    reads = []
+    real_read_excel = pd.read_excel
+
+    def counting_read_excel(file_path, *args, **kwargs):
+        reads.append(file_path)
+        return real_read_excel(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(frame_cache.pd, "read_excel", counting_read_excel)
+    return reads
+
+@pytest.fixture
+def service():
+    service = ReportService(DATA_ROOT, max_workers=2)
+    yield service
+    service.shutdown()
+
+def run_concurrently(func, count):
+    results = [None] * count
+    errors = []
+
+    def worker(i):
+        try:
+            results[i] = func()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+def test_concurrent_identical_requests_are_coalesced(service, monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def slow_generate(path, fmt):
+        calls.append((path, fmt))
+        release.wait(5)
+        return b"report"
+
+    monkeypatch.setattr(service, "_generate", slow_generate)
+    threads, results, errors = run_concurrently(lambda: service.generate(".", "docx"), 5)
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert not errors
+    assert results == [b"report"] * 5
+    assert len(calls) == 1
+    assert not service._in_flight
+
+def test_failed_generation_is_not_kept_in_flight(service, monkeypatch):
+    calls = []
+
+    def failing_once(path, fmt):
+        calls.append(fmt)
+        time.sleep(0.05)
+        if len(calls) == 1:
+            raise RuntimeError("сбой")
+        return b"report"
+
+    monkeypatch.setattr(service, "_generate", failing_once)
+    with pytest.raises(RuntimeError):
+        service.generate(".", "txt")
+
+    assert not service._in_flight
+    assert service.generate(".", "txt") == b"report"
+    assert len(calls) == 2
+
+def test_warm_cache_reads_each_file_once(service, excel_reads, monkeypatch):
+    monkeypatch.setattr(frame_cache, "_frame_cache", None)
+    enable_frame_cache(64)
+
+    real_generate = service._generate
+    calls = []
+
+    def slow_generate(path, fmt):
+        calls.append(fmt)
+        time.sleep(0.3)
+        return real_generate(path, fmt)
+
+    monkeypatch.setattr(service, "_generate", slow_generate)
+    threads, results, errors = run_concurrently(lambda: service.generate(".", "docx"), 5)
+    for thread in threads:
+        thread.join(30)
+
+    assert not errors
+    assert len(set(results)) == 1
+    assert calls == ["docx"]
+    assert len(excel_reads) == 6
+
+    service.generate(".", "json")
+    assert calls == ["docx", "json"]
+    assert len(excel_reads) == 6
+
+def test_resolve_directory_requires_dir(service):
+    with pytest.raises(ValueError):
+        service.resolve_directory("")
+
+def test_resolve_directory_rejects_paths_outside_root(service):
+    with pytest.raises(ValueError):
+        service.resolve_directory("../..")
+
+def test_resolve_directory_requires_part1_or_part2(tmp_path):
+    (tmp_path / "2024-10-21").mkdir()
+    (tmp_path / "2024-10-22" / "part2").mkdir(parents=True)
+    service = ReportService(str(tmp_path))
+    try:
+        with pytest.raises(FileNotFoundError):
+            service.resolve_directory("2024-10-21")
+        with pytest.raises(FileNotFoundError):
+            service.resolve_directory("missing")
+        assert service.resolve_directory("2024-10-22") == str(tmp_path / "2024-10-22")
+    finally:
+        service.shutdown()
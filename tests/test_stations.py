@@ -0,0 +1,81 @@
+import json
+import logging
+import pytest
+import stations
+from stations import MOSCOW, MOSCOW_REGION, StationIndex, get_station_index, load_station_index
+
+@pytest.fixture
+def fallback_index():
+    with open(stations.STATIONS_FILE, encoding="utf-8") as f:
+        data = json.load(f)
+    return StationIndex([], data["fallback_mo_markers"], data["version"])
+
+@pytest.fixture
+def fresh_station_index():
+    get_station_index.cache_clear()
+    yield
+    get_station_index.cache_clear()
+
+def test_known_stations():
+    index = load_station_index()
+
+    assert index.lookup("М2 (Жулебино) (С)") == {
+        "raw_name": "М2 (Жулебино) (С)",
+        "display_name": "Жулебино",
+        "region": MOSCOW,
+        "station_type": "С"
+    }
+    assert index.region("М1-5 (Балашиха-Речная)") == MOSCOW_REGION
+    assert index.display_name("М (Балашиха-Речная) ()") == "Балашиха-Речная"
+    assert index.region("МО-Мытищи ()") == MOSCOW_REGION
+    assert index.display_name("МГУ (П)") == "МГУ"
+    assert index.station_type("Останкино 248 м (Высо)") == "Высо"
+    assert not index._fallback
+
+def test_summary_rows_are_not_stations():
+    index = load_station_index()
+
+    assert "Московская область" not in index
+    assert "Центральный административный округ" not in index
+
+def test_fallback_for_unknown_stations(fallback_index, caplog):
+    with caplog.at_level(logging.WARNING):
+        assert fallback_index.lookup("Новая станция (П)") == {
+            "raw_name": "Новая станция (П)",
+            "display_name": "Новая станция",
+            "region": MOSCOW,
+            "station_type": "П"
+        }
+        assert fallback_index.display_name("Новая станция (П)") == "Новая станция"
+        assert fallback_index.display_name("Новая башня 100 м (Высо)") == "Новая башня 100 м"
+        assert fallback_index.region("МО-Новая ()") == MOSCOW_REGION
+        assert fallback_index.region("Звенигород-2 (С)") == MOSCOW_REGION
+        assert fallback_index.display_name("М2 (Новая) (С)") == "Новая"
+
+    assert "Новая станция (П)" in fallback_index._fallback
+    warnings = [r for r in caplog.records if "Новая станция (П)" in r.getMessage()]
+    assert len(warnings) == 1
+
+def test_get_station_index_loads_once(fresh_station_index, monkeypatch):
+    calls = []
+    real_load = stations.load_station_index
+
+    def counting_load(*args, **kwargs):
+        calls.append(args)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(stations, "load_station_index", counting_load)
+
+    assert get_station_index() is get_station_index()
+    assert len(calls) == 1
+
+@pytest.mark.parametrize("version", [99, None])
+def test_unsupported_version_is_rejected(tmp_path, version):
+    path = tmp_path / "stations.json"
+    data = {"fallback_mo_markers": ["МО"], "stations": []}
+    if version is not None:
+        data["version"] = version
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_station_index(str(path))